@@ -0,0 +1,23 @@
+from rest_framework.response import Response
+
+
+class APIResponse(Response):
+    """Standard success envelope for API views."""
+
+    def __init__(self, data=None, status=None, message="", **kwargs):
+        self.message = message
+        super().__init__({} if data is None else data, status=status, **kwargs)
+        self.configure_response()
+
+    def configure_response(self):
+        body = dict(self.data)
+        if self.message:
+            body["message"] = self.message
+        self.data = body
+
+
+class ErrorAPIResponse(Response):
+    """Error envelope; wraps the message under an ``error`` key."""
+
+    def __init__(self, message="", status=None, **kwargs):
+        super().__init__({"error": message}, status=status, **kwargs)
@@ -0,0 +1,6 @@
+from django.contrib import admin
+
+from processing.models import ProcessingRequest, Product
+
+admin.site.register(ProcessingRequest)
+admin.site.register(Product)
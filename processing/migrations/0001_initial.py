@@ -0,0 +1,37 @@
+# Generated by Django 5.2.17 on 2026-08-31 16:52
+
+import django.db.models.deletion
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='ProcessingRequest',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('request_id', models.CharField(max_length=255, unique=True)),
+                ('completed', models.BooleanField(default=False)),
+                ('created_at', models.DateTimeField(auto_now_add=True)),
+                ('result_file', models.FileField(blank=True, null=True, upload_to='results/')),
+            ],
+        ),
+        migrations.CreateModel(
+            name='Product',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('serial_number', models.IntegerField()),
+                ('name', models.CharField(max_length=255)),
+                ('input_image_urls', models.TextField()),
+                ('output_image_urls', models.TextField(blank=True, default='')),
+                ('processed', models.BooleanField(default=False)),
+                ('request', models.ForeignKey(on_delete=django.db.models.deletion.CASCADE, to='processing.processingrequest')),
+            ],
+        ),
+    ]
@@ -0,0 +1,19 @@
+# Generated by Django 5.2.17 on 2026-08-31 17:00
+
+import uuid
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    dependencies = [
+        ('processing', '0002_alter_product_request'),
+    ]
+
+    operations = [
+        migrations.AlterField(
+            model_name='processingrequest',
+            name='request_id',
+            field=models.UUIDField(db_index=True, default=uuid.uuid4, editable=False, unique=True),
+        ),
+    ]
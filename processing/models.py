@@ -0,0 +1,33 @@
+import uuid
+
+from django.db import models
+
+
+class ProcessingRequest(models.Model):
+    """One CSV upload and its processing lifecycle."""
+
+    request_id = models.UUIDField(
+        unique=True, db_index=True, default=uuid.uuid4, editable=False
+    )
+    completed = models.BooleanField(default=False)
+    created_at = models.DateTimeField(auto_now_add=True)
+    result_file = models.FileField(upload_to="results/", null=True, blank=True)
+
+    def __str__(self):
+        return str(self.request_id)
+
+
+class Product(models.Model):
+    """A single CSV row: one product with its input and output image URLs."""
+
+    request = models.ForeignKey(
+        ProcessingRequest, related_name="products", on_delete=models.CASCADE
+    )
+    serial_number = models.IntegerField()
+    name = models.CharField(max_length=255)
+    input_image_urls = models.TextField()
+    output_image_urls = models.TextField(blank=True, default="")
+    processed = models.BooleanField(default=False)
+
+    def __str__(self):
+        return self.name
@@ -0,0 +1,23 @@
+from rest_framework import serializers
+
+from processing.models import ProcessingRequest, Product
+
+
+class ProductSerializer(serializers.ModelSerializer):
+    class Meta:
+        model = Product
+        fields = [
+            "serial_number",
+            "name",
+            "input_image_urls",
+            "output_image_urls",
+            "processed",
+        ]
+
+
+class ProcessingRequestSerializer(serializers.ModelSerializer):
+    products = ProductSerializer(many=True, read_only=True)
+
+    class Meta:
+        model = ProcessingRequest
+        fields = ["request_id", "completed", "created_at", "result_file", "products"]
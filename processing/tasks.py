@@ -0,0 +1,296 @@
+import asyncio
+import csv
+import hashlib
+import io
+import logging
+import os
+from concurrent.futures import ThreadPoolExecutor
+from tempfile import SpooledTemporaryFile
+from uuid import uuid4
+
+import aiohttp
+from celery import chord, shared_task
+from django.conf import settings
+from django.db import OperationalError
+from django.core.cache import cache
+from django.core.files import File
+from PIL import Image
+
+from processing.models import ProcessingRequest, Product
+
+try:
+    import pyvips
+except ImportError:  # optional fast path; Pillow remains the fallback
+    pyvips = None
+
+try:
+    import mozjpeg_lossless_optimization
+except ImportError:  # optional; skips re-encoding small JPEG inputs
+    mozjpeg_lossless_optimization = None
+
+logger = logging.getLogger(__name__)
+
+OUTPUT_COLUMNS = [
+    "Serial Number",
+    "Product Name",
+    "Input Image Urls",
+    "Output Image Urls",
+]
+
+MAX_WORKERS = 16
+
+# Longest edge of a stored image; lets the JPEG decoder shrink-on-load.
+MAX_IMAGE_SIZE = 1600
+
+# How long a processed-image URL stays in the shared dedup cache.
+DEDUP_CACHE_TIMEOUT = 7 * 86400
+
+JPEG_MAGIC = b"\xff\xd8\xff"
+
+
+def _dedup_cache_key(url):
+    return "img:{digest}".format(
+        digest=hashlib.sha256(url.encode("utf-8")).hexdigest()
+    )
+
+
+def _write_bytes(file_path, data):
+    with open(file_path, "wb") as f:
+        f.write(data)
+
+
+@shared_task(
+    bind=True,
+    autoretry_for=(OperationalError,),
+    retry_backoff=True,
+    max_retries=5,
+)
+def process_request(self, request_id):
+    """Fan a request out as a chord of per-product subtasks."""
+    processing_request = ProcessingRequest.objects.get(request_id=request_id)
+    product_ids = list(processing_request.products.values_list("pk", flat=True))
+    chord([process_product.s(pid) for pid in product_ids])(
+        finalize.s(request_id)
+    )
+
+
+@shared_task
+def process_product(product_id):
+    """Process every image URL of one product and persist its outputs."""
+    product = Product.objects.select_related("request").get(pk=product_id)
+    task = ImageProcessingTask(product.request)
+    task.process_product(product)
+    product.save(update_fields=["output_image_urls", "processed"])
+    return product.pk
+
+
+@shared_task
+def finalize(results, request_id):
+    """Chord callback: write the result CSV and mark the request done."""
+    processing_request = ProcessingRequest.objects.get(request_id=request_id)
+    task = ImageProcessingTask(processing_request)
+    task.generate_csv()
+    task.complete_request()
+
+
+class ImageProcessingTask:
+    """Download, compress and store every image referenced by a request."""
+
+    def __init__(self, processing_request):
+        self.processing_request = processing_request
+        self.request_id = processing_request.request_id
+        # Task-local dedup; the shared cache handles repeats across tasks.
+        self._url_cache = {}
+        # Small pool for flushing encoded bytes to storage, so the next
+        # image's decode does not wait on the previous image's write.
+        self.io_pool = ThreadPoolExecutor(max_workers=4)
+        self._write_futures = []
+
+    async def _fetch(self, session, url):
+        async with session.get(
+            url, timeout=aiohttp.ClientTimeout(total=30)
+        ) as response:
+            response.raise_for_status()
+            return await response.read()
+
+    async def _fetch_all(self, urls):
+        # The connector keeps connections alive across URLs on the same
+        # host, so repeated CDN hosts pay one TCP+TLS handshake, not N.
+        connector = aiohttp.TCPConnector(
+            limit=64, limit_per_host=8, ttl_dns_cache=300
+        )
+        async with aiohttp.ClientSession(connector=connector) as session:
+            return await asyncio.gather(
+                *(self._fetch(session, url) for url in urls),
+                return_exceptions=True,
+            )
+
+    def _process_one(self, url, data):
+        """Re-encode one downloaded image at reduced quality and store it.
+
+        ``data`` is either the raw bytes or the download exception. Returns
+        the URL of the stored copy, or None if the image could not be
+        processed.
+        """
+        if isinstance(data, BaseException):
+            logger.error(
+                "Failed to download image from URL: %s", url, exc_info=data
+            )
+            return None
+        try:
+            logger.debug("Processing image from URL: %s", url)
+            file_name = "{uuid}.jpg".format(uuid=uuid4().hex)
+            file_path = os.path.join(settings.MEDIA_ROOT, "processed", file_name)
+            os.makedirs(os.path.dirname(file_path), exist_ok=True)
+            encoded = self._encode(data)
+            self._write_futures.append(
+                (url, self.io_pool.submit(_write_bytes, file_path, encoded))
+            )
+            return "{media_url}processed/{file_name}".format(
+                media_url=settings.MEDIA_URL, file_name=file_name
+            )
+        except Exception:
+            logger.exception("Failed to process image from URL: %s", url)
+            return None
+
+    def _encode(self, data):
+        """Compress one downloaded image, returning the encoded bytes."""
+        if (
+            mozjpeg_lossless_optimization is not None
+            and data[:3] == JPEG_MAGIC
+        ):
+            # Image.open only parses the header here, so sizing a JPEG to
+            # decide whether a resize is needed costs no pixel decode.
+            width, height = Image.open(io.BytesIO(data)).size
+            if max(width, height) <= MAX_IMAGE_SIZE:
+                # Re-runs entropy coding only; no IDCT/FDCT round-trip and
+                # no generation loss.
+                return mozjpeg_lossless_optimization.optimize(data)
+        if pyvips is not None:
+            return self._encode_vips(data)
+        return self._encode_pillow(io.BytesIO(data))
+
+    def _encode_vips(self, data):
+        """Resize and re-encode through libvips (SIMD decode/encode).
+
+        thumbnail_buffer shrinks on load and streams the decode→resize→
+        encode pipeline in horizontal strips with sequential access, so
+        only a few scanlines are resident instead of the full pixel
+        buffer.
+        """
+        vips_img = pyvips.Image.thumbnail_buffer(
+            data, MAX_IMAGE_SIZE, height=MAX_IMAGE_SIZE, size="down"
+        )
+        return vips_img.jpegsave_buffer(
+            Q=50, optimize_coding=True, interlace=True, strip=True
+        )
+
+    def _encode_pillow(self, fp):
+        """Resize and re-encode with Pillow (portable fallback)."""
+        img = Image.open(fp)
+        # draft() lets libjpeg decode straight to 1/2, 1/4 or 1/8 scale
+        # during the IDCT, so thumbnail() starts from far fewer pixels.
+        img.draft("RGB", (MAX_IMAGE_SIZE, MAX_IMAGE_SIZE))
+        img.thumbnail((MAX_IMAGE_SIZE, MAX_IMAGE_SIZE), Image.Resampling.LANCZOS)
+        if img.mode != "RGB":
+            # Normalize P/CMYK/alpha inputs so the JPEG encoder accepts them.
+            img = img.convert("RGB")
+        out = io.BytesIO()
+        # subsampling=2 is 4:2:0 (quarter the chroma samples through the
+        # FDCT); empty exif/icc drop whatever metadata the source carried.
+        img.save(
+            out,
+            format="JPEG",
+            quality=50,
+            subsampling=2,
+            optimize=True,
+            progressive=True,
+            exif=b"",
+            icc_profile=None,
+        )
+        return out.getvalue()
+
+    def process_product(self, product):
+        """Process one product's URLs, overlapping them on a thread pool."""
+        urls = [u.strip() for u in product.input_image_urls.split(",") if u.strip()]
+        outputs = {}
+        for url in urls:
+            cached = self._url_cache.get(url) or cache.get(_dedup_cache_key(url))
+            if cached:
+                self._url_cache[url] = cached
+                outputs[url] = cached
+
+        # Unique cache misses only, in first-seen order.
+        pending = list(dict.fromkeys(u for u in urls if u not in outputs))
+        if pending:
+            payloads = asyncio.run(self._fetch_all(pending))
+            # Downloads are done; the pool now only overlaps encodes, which
+            # release the GIL inside libjpeg/libvips.
+            with ThreadPoolExecutor(
+                max_workers=min(MAX_WORKERS, len(pending))
+            ) as executor:
+                encoded = list(executor.map(self._process_one, pending, payloads))
+            for url, image_url in zip(pending, encoded):
+                outputs[url] = image_url
+                if image_url:
+                    self._url_cache[url] = image_url
+                    cache.set(
+                        _dedup_cache_key(url),
+                        image_url,
+                        timeout=DEDUP_CACHE_TIMEOUT,
+                    )
+
+        # Drain the write pool before reporting anything: a URL whose file
+        # never made it to storage must not survive in the product row, the
+        # task-local cache or the shared dedup cache.
+        for url, future in self._write_futures:
+            try:
+                future.result()
+            except Exception:
+                logger.exception(
+                    "Failed to write processed image for URL: %s", url
+                )
+                outputs[url] = None
+                self._url_cache.pop(url, None)
+                cache.delete(_dedup_cache_key(url))
+        self._write_futures = []
+        self.io_pool.shutdown(wait=True)
+
+        results = [outputs.get(url) for url in urls]
+        product.output_image_urls = ",".join(u for u in results if u)
+        product.processed = True
+        return product
+
+    def generate_csv(self):
+        rows = [
+            (
+                product.serial_number,
+                product.name,
+                product.input_image_urls,
+                product.output_image_urls,
+            )
+            for product in self.processing_request.products.all()
+        ]
+        # Spill to disk past 4MB so huge requests never hold the whole CSV
+        # in memory; the storage backend wants bytes, so the csv text layer
+        # is detached after flushing.
+        buf = SpooledTemporaryFile(max_size=4 * 1024 * 1024)
+        text = io.TextIOWrapper(buf, encoding="utf-8", newline="")
+        writer = csv.writer(text)
+        writer.writerow(OUTPUT_COLUMNS)
+        writer.writerows(rows)
+        text.flush()
+        text.detach()
+        buf.seek(0)
+        self.processing_request.result_file.save(
+            "{request_id}.csv".format(request_id=self.request_id),
+            File(buf),
+            save=False,
+        )
+
+    def complete_request(self):
+        self.processing_request.completed = True
+        self.processing_request.save()
+        logger.info(
+            "Completed processing request. Request ID: %s", self.request_id
+        )
@@ -0,0 +1,10 @@
+from django.urls import path
+
+from processing.views import StatusCheckView, UploadCSVView
+
+urlpatterns = [
+    path("upload/", UploadCSVView.as_view(), name="upload-csv"),
+    path(
+        "status/<uuid:request_id>/", StatusCheckView.as_view(), name="status-check"
+    ),
+]
@@ -0,0 +1,120 @@
+import csv
+import io
+import logging
+from operator import itemgetter
+from uuid import uuid4
+
+from django.db import transaction
+from django.shortcuts import get_object_or_404
+from rest_framework.parsers import FormParser, MultiPartParser
+from rest_framework.views import APIView
+
+from image_processor.response import APIResponse, ErrorAPIResponse
+from processing.models import ProcessingRequest, Product
+from processing.serializers import ProcessingRequestSerializer
+from processing.tasks import process_request
+
+logger = logging.getLogger(__name__)
+
+REQUIRED_COLUMNS = ["Serial Number", "Product Name", "Input Image Urls"]
+
+
+class UploadCSVView(APIView):
+    """Accept a product CSV, persist its rows and kick off image processing."""
+
+    parser_classes = [MultiPartParser, FormParser]
+
+    def post(self, request):
+        file_obj = request.FILES.get("file")
+        if file_obj is None:
+            return ErrorAPIResponse(message="No file provided.", status=400)
+
+        request_id = str(uuid4())
+        logger.info("Received CSV upload request. Request ID: %s", request_id)
+
+        reader = csv.reader(
+            io.TextIOWrapper(file_obj, encoding="utf-8", newline="")
+        )
+        header = next(reader, None) or []
+        missing_columns = sorted(set(REQUIRED_COLUMNS).difference(header))
+        if missing_columns:
+            logger.error(
+                "CSV upload rejected, missing columns: %s",
+                ", ".join(missing_columns),
+            )
+            return ErrorAPIResponse(
+                message="Missing required columns: {cols}".format(
+                    cols=", ".join(missing_columns)
+                ),
+                status=400,
+            )
+
+        # Bind the required columns to their positions once; itemgetter then
+        # extracts all three per row in a single C-level call.
+        idx = {name: header.index(name) for name in REQUIRED_COLUMNS}
+        get_columns = itemgetter(
+            idx["Serial Number"], idx["Product Name"], idx["Input Image Urls"]
+        )
+        max_column = max(idx.values())
+
+        # Parse and validate every row before touching the database, so a
+        # malformed file can be rejected without a half-written request.
+        rows = []
+        for line_number, row in enumerate(reader, start=2):
+            if not row:
+                continue
+            if len(row) <= max_column:
+                return ErrorAPIResponse(
+                    message="Malformed CSV row at line {line}.".format(
+                        line=line_number
+                    ),
+                    status=400,
+                )
+            serial_number, name, input_image_urls = get_columns(row)
+            try:
+                serial_number = int(serial_number)
+            except ValueError:
+                return ErrorAPIResponse(
+                    message="Invalid serial number {value!r} at line {line}.".format(
+                        value=serial_number, line=line_number
+                    ),
+                    status=400,
+                )
+            rows.append((serial_number, name, input_image_urls))
+
+        with transaction.atomic():
+            processing_request = ProcessingRequest.objects.create(
+                request_id=request_id
+            )
+            products = [
+                Product(
+                    request=processing_request,
+                    serial_number=serial_number,
+                    name=name,
+                    input_image_urls=input_image_urls,
+                )
+                for serial_number, name, input_image_urls in rows
+            ]
+            Product.objects.bulk_create(products, batch_size=1000)
+
+        process_request.delay(request_id)
+
+        return APIResponse(
+            data={"request_id": request_id},
+            message="CSV accepted for processing.",
+            status=202,
+        )
+
+
+class StatusCheckView(APIView):
+    """Report the current state of a processing request."""
+
+    def get(self, request, request_id):
+        processing_request = get_object_or_404(
+            ProcessingRequest.objects.only(
+                "id", "request_id", "created_at", "completed", "result_file"
+            ).prefetch_related("products"),
+            request_id=request_id,
+        )
+        serializer = ProcessingRequestSerializer(processing_request)
+        return APIResponse(data=serializer.data, status=200)